@@ -1,22 +1,50 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
 import csv
+import hashlib
+import io
+import multiprocessing
 import os
 import re
 import sys
 import time
-from typing import Dict, Generator, Iterable, List, Optional, Tuple
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
 
-import requests
+import httpx
+import orjson
 
 BASE_PUBLIC   = "https://bracketteam.com/api/get-public-tournament"
 BASE_SCHEDULE = "https://bracketteam.com/api/get-division-schedule"
 
-MATCHES_PER_PAGE = 20
-SLEEP_TIME = 0.5     # polite throttle between pages
+DEFAULT_PAGE_SIZE = 100   # what we ask for unless --page-size says otherwise
 TIMEOUT    = 30
 MAX_RETRIES = 3
 BACKOFF     = 1.5    # exponential backoff factor
+MAX_CONCURRENT_DIVISIONS = 16   # divisions fetched at once
+MAX_CONCURRENT_PAGES = 32       # schedule pages in flight across all divisions
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE   = 32    # idle connections kept pooled
+KEEPALIVE_TIMEOUT = 60  # seconds an idle connection stays pooled
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+JSON_CACHE_SIZE = 1024  # parsed responses kept in memory
+FAILED_FETCH_TTL = 5    # seconds a failed fetch is shared before it may be retried
+PARSE_IN_THREAD_BYTES = 32_000  # bodies larger than this are parsed off the event loop
+PARSE_WORKERS = 4
+CSV_BUFFER_SIZE = 1 << 20  # bytes buffered before each write(2)
+RATE_LIMIT_WINDOW = 60     # assumed window (s) when X-RateLimit-Reset is absent
+RATE_LIMIT_LOW_WATER = 0.1 # start spacing requests below this share of the limit
+DISK_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "bballsched"
+DISK_CACHE_TTL = 3600      # seconds a cached response is served without refetching
+
+disk_cache_enabled = True  # cleared by --no-cache
+
+_EVENT_RE = re.compile(r"/event/(\d+)/")
 
 # --- Helpers -----------------------------------------------------------------
 
@@ -25,68 +53,348 @@ def parse_event_id(s: str) -> int:
     Accept either a numeric tournament/event id or a schedules page URL like:
       https://bracketteam.com/event/6489/2025_Fall_Tip_Off/schedules
     """
-    m = re.search(r"/event/(\d+)/", s)
+    s = s.strip()
+    if s.isdecimal():
+        return int(s)
+    m = _EVENT_RE.search(s)
     if m:
         return int(m.group(1))
-    if re.fullmatch(r"\d+", s.strip()):
-        return int(s)
     raise ValueError(f"Could not parse event/tournament id from: {s}")
 
-def make_session(token: str) -> requests.Session:
-    sess = requests.Session()
-    sess.headers.update({
-        "User-Agent": "BracketTeamScraper/1.0 (+https://example.org)",
-        "Accept": "application/json, */*",
-        "X-Authorization": token,
-    })
-    return sess
+def make_client(token: str) -> httpx.AsyncClient:
+    # HTTP/2 multiplexes every request to bracketteam.com over one TLS
+    # connection, so concurrency is bounded by our semaphores, not the pool.
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE,
+            keepalive_expiry=KEEPALIVE_TIMEOUT,
+        ),
+        timeout=TIMEOUT,
+        headers={
+            "User-Agent": "BracketTeamScraper/1.0 (+https://example.org)",
+            "Accept": "application/json, */*",
+            "X-Authorization": token,
+        },
+    )
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# LRU of in-flight or finished fetches keyed by (url, sorted params)
+_JSON_CACHE: "OrderedDict[CacheKey, asyncio.Future]" = OrderedDict()
+
 
-def get_json(session: requests.Session, url: str, params: Dict[str, str]) -> Optional[dict]:
+def cache_key(url: str, params: Dict[str, object]) -> CacheKey:
+    return (url, tuple(sorted((k, str(v)) for k, v in params.items())))
+
+
+async def get_json(client: httpx.AsyncClient, url: str, params: Dict[str, object]) -> Optional[dict]:
     """
-    GET with simple retry on 5xx/429 and JSON parse safety.
-    Returns parsed JSON dict or None on failure.
+    Memoized load_json. The cache holds the future of the fetch rather than
+    its result, so callers arriving while a request is still in flight
+    await that same request instead of issuing their own. Failed fetches
+    are evicted after FAILED_FETCH_TTL.
+    """
+    key = cache_key(url, params)
+    fut = _JSON_CACHE.get(key)
+    if fut is not None:
+        _JSON_CACHE.move_to_end(key)
+        return await asyncio.shield(fut)
+
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    _JSON_CACHE[key] = fut
+    if len(_JSON_CACHE) > JSON_CACHE_SIZE:
+        _JSON_CACHE.popitem(last=False)
+    try:
+        data = await load_json(client, url, params)
+    except asyncio.CancelledError:
+        _JSON_CACHE.pop(key, None)
+        fut.cancel()
+        raise
+    except Exception as e:
+        _JSON_CACHE.pop(key, None)
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved; waiters still see it
+        raise
+    fut.set_result(data)
+    if data is None:
+        loop.call_later(FAILED_FETCH_TTL, _evict, key, fut)
+    return data
+
+
+def disk_cache_path(url: str, params: Dict[str, object]) -> Path:
+    query = urlencode(sorted((k, str(v)) for k, v in params.items()))
+    return DISK_CACHE_DIR / (hashlib.blake2b(f"{url}?{query}".encode()).hexdigest() + ".json")
+
+
+def disk_cache_get(url: str, params: Dict[str, object]) -> Tuple[Optional[dict], bool]:
+    """
+    Returns (entry, fresh). An entry is {"data", "etag", "last_modified"};
+    a stale one is still returned so its validators can be replayed.
+    """
+    path = disk_cache_path(url, params)
+    try:
+        fresh = time.time() - path.stat().st_mtime <= DISK_CACHE_TTL
+        entry = orjson.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None, False
+    if not isinstance(entry, dict) or "data" not in entry:
+        return None, False
+    return entry, fresh
+
+
+def disk_cache_put(url: str, params: Dict[str, object], entry: dict) -> None:
+    path = disk_cache_path(url, params)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_bytes(orjson.dumps(entry))
+        os.replace(tmp, path)
+    except OSError as e:
+        sys.stderr.write(f"Could not write cache entry {path} :: {e}\n")
+
+
+def disk_cache_touch(url: str, params: Dict[str, object]) -> None:
+    try:
+        os.utime(disk_cache_path(url, params))
+    except OSError:
+        pass
+
+
+async def load_json(client: httpx.AsyncClient, url: str, params: Dict[str, object]) -> Optional[dict]:
     """
-    attempt = 0
+    fetch_json behind the on-disk cache (unless disabled with --no-cache).
+    Fresh entries skip the network; stale ones are revalidated with
+    If-None-Match/If-Modified-Since and reused on a 304, or served as-is
+    when the server cannot be reached or returns garbage.
+    """
+    if not disk_cache_enabled:
+        return await fetch_json(client, url, params)
+    entry, fresh = disk_cache_get(url, params)
+    if entry is not None and fresh:
+        return entry["data"]
+
+    validators: Dict[str, str] = {}
+    if entry is not None:
+        if entry.get("etag"):
+            validators["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            validators["If-Modified-Since"] = entry["last_modified"]
+    resp = await request(client, url, params, validators or None)
+    if resp is None:
+        return stale_fallback(url, entry)
+    if resp.status_code == 304:
+        disk_cache_touch(url, params)
+        return entry["data"]
+
+    data = await parse_json(resp)
+    if data is not None:
+        disk_cache_put(url, params, {
+            "data": data,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        })
+        return data
+    return stale_fallback(url, entry)
+
+
+def stale_fallback(url: str, entry: Optional[dict]) -> Optional[dict]:
+    if entry is None:
+        return None
+    sys.stderr.write(f"Using stale cached response: {url}\n")
+    return entry["data"]
+
+
+def _evict(key: CacheKey, fut: asyncio.Future) -> None:
+    if _JSON_CACHE.get(key) is fut:
+        del _JSON_CACHE[key]
+
+
+async def request(
+        client: httpx.AsyncClient,
+        url: str,
+        params: Dict[str, object],
+        headers: Optional[Dict[str, str]] = None) -> Optional[httpx.Response]:
+    """
+    GET with retry on RETRY_STATUSES/connection errors.
+    Requests are paced by the host's RateLimiter; a Retry-After on a retried
+    response replaces the exponential backoff.
+    Returns a 2xx response (or 304 to a conditional request), None on failure.
+    """
+    limiter = limiter_for(url)
     delay = BACKOFF
-    while True:
-        attempt += 1
+    backoff = False
+    for attempt in range(1, MAX_RETRIES + 1):
+        if backoff:
+            await asyncio.sleep(delay)
+            delay *= BACKOFF
+        backoff = True
+        await limiter.wait()
         try:
-            resp = session.get(url, params=params, timeout=TIMEOUT)
-            # Retry on rate limit or 5xx
-            if resp.status_code in (429,) or 500 <= resp.status_code < 600:
-                if attempt < MAX_RETRIES:
-                    time.sleep(delay)
-                    delay *= BACKOFF
-                    continue
-                else:
-                    sys.stderr.write(f"HTTP {resp.status_code} after {attempt} attempts: {resp.url}\n")
-                    return None
-
-            if not resp.ok:
-                sys.stderr.write(f"HTTP {resp.status_code}: {resp.url}\n")
-                return None
-            return resp.json()
-        except requests.RequestException as e:
+            resp = await client.get(url, params=params, headers=headers)
+        except httpx.HTTPError as e:
             if attempt < MAX_RETRIES:
-                time.sleep(delay)
-                delay *= BACKOFF
                 continue
             sys.stderr.write(f"Request error after {attempt} attempts: {url} :: {e}\n")
             return None
-        except ValueError as e:
-            sys.stderr.write(f"JSON parse error: {url} :: {e}\n")
+        limiter.update(resp.headers)
+        if resp.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            retry_after = parse_retry_after(resp.headers.get("Retry-After"))
+            if retry_after is not None:
+                limiter.pause(retry_after)
+                backoff = False
+            continue
+        if resp.status_code == 304 and headers:
+            return resp
+        if not resp.is_success:
+            sys.stderr.write(f"HTTP {resp.status_code} after {attempt} attempts: {resp.url}\n")
             return None
+        return resp
+    return None
+
+
+async def parse_json(resp: httpx.Response) -> Optional[dict]:
+    """
+    Parses the body, off the event loop when it is large.
+    Returns None (and logs) if it is not JSON.
+    """
+    body = resp.content
+    try:
+        if len(body) > PARSE_IN_THREAD_BYTES:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, orjson.loads, body)
+        return orjson.loads(body)
+    except ValueError as e:
+        sys.stderr.write(f"JSON parse error: {resp.url} :: {e}\n")
+        return None
+
+
+async def fetch_json(client: httpx.AsyncClient, url: str, params: Dict[str, object]) -> Optional[dict]:
+    """
+    Returns parsed JSON dict or None on failure.
+    """
+    resp = await request(client, url, params)
+    if resp is None:
+        return None
+    return await parse_json(resp)
+
+# --- Rate limiting ------------------------------------------------------------
+
+
+def _header_int(value: Optional[str]) -> Optional[int]:
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After is either delta-seconds or an HTTP date.
+    """
+    if value is None:
+        return None
+    seconds = _header_int(value)
+    if seconds is not None:
+        return max(0.0, float(seconds))
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    Spaces out requests to one host based on the X-RateLimit-* headers it
+    returns: no spacing while there is headroom, the remaining budget spread
+    over the rest of the window once it runs low (and nothing more sent
+    until the window resets once it is spent), and a hard pause on 429.
+    """
+
+    def __init__(self) -> None:
+        self.min_interval = 0.0
+        self._next_slot = 0.0     # earliest start for the next request
+        self._pause_until = 0.0   # Retry-After deadline; not undone by update()
+        self._budget: Optional[int] = None  # requests left in this window, if known
+        self._reset_at = 0.0
+        self._wake: Optional[asyncio.Future] = None
+
+    async def wait(self) -> None:
+        # Nothing is booked ahead: a waiter re-checks on waking (or when
+        # update() signals new headers) and only then takes the next slot.
+        while True:
+            now = time.monotonic()
+            if self._budget is not None and now >= self._reset_at:
+                # new window; the next response tells us its budget
+                self._budget = None
+                self.min_interval = 0.0
+            target = max(self._next_slot, self._pause_until)
+            if self._budget is not None and self._budget <= 0:
+                target = max(target, self._reset_at)
+            if target <= now:
+                self._next_slot = now + self.min_interval
+                if self._budget is not None:
+                    self._budget -= 1
+                return
+            loop = asyncio.get_running_loop()
+            if self._wake is None or self._wake.get_loop() is not loop:
+                self._wake = loop.create_future()
+            await asyncio.wait([self._wake], timeout=target - now)
+
+    def pause(self, seconds: float) -> None:
+        self._pause_until = max(self._pause_until, time.monotonic() + seconds)
+
+    def update(self, headers: httpx.Headers) -> None:
+        remaining = _header_int(headers.get("X-RateLimit-Remaining"))
+        if remaining is None:
+            return
+        now = time.monotonic()
+        limit = _header_int(headers.get("X-RateLimit-Limit"))
+        window = _header_int(headers.get("X-RateLimit-Reset"))
+        if window is None:
+            window = RATE_LIMIT_WINDOW
+        elif window > 1_000_000_000:  # epoch timestamp rather than seconds
+            window = max(0, window - int(time.time()))
+        self._budget = max(0, remaining)
+        self._reset_at = now + window
+        if limit and remaining > limit * RATE_LIMIT_LOW_WATER:
+            self.min_interval = 0.0
+            self._next_slot = now
+        else:
+            self.min_interval = window / (self._budget + 1)
+            self._next_slot = min(self._next_slot, now + self.min_interval)
+        self._wakeup()
+
+    def _wakeup(self) -> None:
+        wake, self._wake = self._wake, None
+        if wake is not None and not wake.done() and not wake.get_loop().is_closed():
+            wake.set_result(None)
+
+
+_LIMITERS: Dict[str, RateLimiter] = {}
+
+
+def limiter_for(url: str) -> RateLimiter:
+    host = urlsplit(url).netloc
+    limiter = _LIMITERS.get(host)
+    if limiter is None:
+        limiter = _LIMITERS[host] = RateLimiter()
+    return limiter
 
 # --- API wrappers -------------------------------------------------------------
 
 
-def get_divisions(
-        session: requests.Session, tournament_id: int) -> List[Tuple[int, str]]:
+async def get_divisions(
+        client: httpx.AsyncClient, tournament_id: int) -> List[Tuple[int, str]]:
     """
     Returns list of (division_id, division_name)
     """
     params = {"tournament_id": tournament_id}
-    data = get_json(session, BASE_PUBLIC, params) or {}
+    data = await get_json(client, BASE_PUBLIC, params) or {}
     divisions = (data.get("content", {}) \
                      .get("tournament", {}) \
                      .get("divisions", []))
@@ -99,90 +407,182 @@ def get_divisions(
     return out
 
 
-def iter_matches(session: requests.Session, tournament_id: int, division_id: int) -> Generator[dict, None, None]:
+def schedule_params(
+        tournament_id: int, division_id: int, page: int, per_page: int) -> Dict[str, object]:
+    return {
+        "tournament_id": tournament_id,
+        "division_id": division_id,
+        "page": page,
+        "start_date": "null",
+        "end_date": "null",
+        "filter_team": "null",
+        "pool_id": "null",
+        "bracket_id": "null",
+        "venue_id": "null",
+        "court_id": "null",
+        "matches_per_page": per_page,
+        "only_games": "false",
+    }
+
+
+def last_page_of(content: dict, per_page: int) -> Optional[int]:
+    """
+    Reads the page count from schedule metadata, if the payload carries any.
+    """
+    for key in ("last_page", "total_pages"):
+        v = content.get(key)
+        if isinstance(v, int) or (isinstance(v, str) and v.isdigit()):
+            return int(v)
+    total = content.get("total")
+    if isinstance(total, int) or (isinstance(total, str) and total.isdigit()):
+        return -(-int(total) // per_page)
+    return None
+
+
+def served_page_size(content: dict, n: int, page_size: int) -> int:
+    """
+    Works out the page size the server actually used for a first page of n
+    matches when page_size were requested. A short first page is either the
+    whole division or a server-side cap. Only metadata can say it is the
+    whole division; without it we assume a cap of n and keep paging, which
+    costs one extra request for a division that really was that small.
+    """
+    if n >= page_size:
+        return page_size
+    last_page = last_page_of(content, n)
+    if last_page is not None and last_page <= 1:
+        return page_size
+    return n
+
+
+async def iter_matches(
+        client: httpx.AsyncClient,
+        page_sem: asyncio.Semaphore,
+        tournament_id: int,
+        division_id: int,
+        page_size: int = DEFAULT_PAGE_SIZE) -> AsyncGenerator[dict, None]:
     """
     Yields match dicts across pages for a single division.
+
+    Page 1 is fetched first; if it reports a page count the remaining pages
+    are requested concurrently, otherwise we keep paging until a short page.
+    If the server capped page 1 below page_size, later pages use its size.
     """
-    page = 1
+    async def fetch_page(page: int, per_page: int) -> List[dict]:
+        async with page_sem:
+            data = await get_json(client, BASE_SCHEDULE,
+                                  schedule_params(tournament_id, division_id, page, per_page)) or {}
+        return (data.get("content", {}) or {}).get("matches", []) or []
+
+    async with page_sem:
+        data = await get_json(client, BASE_SCHEDULE,
+                              schedule_params(tournament_id, division_id, 1, page_size)) or {}
+    content = data.get("content", {}) or {}
+    matches = content.get("matches", []) or []
+    if not matches:
+        return
+    for m in matches:
+        yield m
+    per_page = served_page_size(content, len(matches), page_size)
+    if len(matches) < per_page:
+        return
+
+    last_page = last_page_of(content, per_page)
+    if last_page is not None:
+        # gather preserves argument order, so pages come back in page order
+        pages = await asyncio.gather(*[fetch_page(p, per_page)
+                                       for p in range(2, last_page + 1)])
+        for matches in pages:
+            for m in matches:
+                yield m
+        return
+
+    page = 2
     while True:
-        params = {
-            "tournament_id": tournament_id,
-            "division_id": division_id,
-            "page": page,
-            "start_date": "null",
-            "end_date": "null",
-            "filter_team": "null",
-            "pool_id": "null",
-            "bracket_id": "null",
-            "venue_id": "null",
-            "court_id": "null",
-            "matches_per_page": MATCHES_PER_PAGE,
-            "only_games": "false",
-        }
-        data = get_json(session, BASE_SCHEDULE, params) or {}
-        matches = (data.get("content", {}) or {}).get("matches", []) or []
+        matches = await fetch_page(page, per_page)
         if not matches:
             break
         for m in matches:
             yield m
-        if len(matches) < MATCHES_PER_PAGE:
+        if len(matches) < per_page:
             break
         page += 1
-        time.sleep(SLEEP_TIME)
 
 # --- Field extraction (defensive) --------------------------------------------
 
 
-def first_nonempty(*values) -> str:
-    for v in values:
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-    return ""
+# Candidate key paths per field, tried in order; first non-blank string wins.
+TIME_PATHS = (
+    ("start_date_time",),
+    ("date",),
+    ("start_time",),
+    ("start_datetime",),
+    # Sometimes “start_time” is separate and needs the date
+)
+LOCATION_PATHS = (
+    ("court", "venue", "name"),
+    ("venue_name",),
+    ("facility_name",),
+    ("location",),
+    ("venue", "name"),
+    ("facility", "name"),
+    ("site", "name"),
+)
+COURT_PATHS = (
+    ("court", "court_name"),
+    ("court_name",),
+    ("court",),
+    ("field",),
+    ("court", "name"),
+    ("resource", "name"),
+)
+HOME_TEAM = sys.intern("home_team")
+AWAY_TEAM = sys.intern("away_team")
+HOME_NAME_PATHS = (("home_name",), ("homeTeamName",), ("team_home_name",))
+AWAY_NAME_PATHS = (("away_name",), ("awayTeamName",), ("team_away_name",))
+
+
+_EMPTY: dict = {}  # shared stand-in for missing nested objects; never mutated
+
+
+def normalize(m: dict) -> dict:
+    """
+    Makes home_team/away_team always a dict so the team extractors need no
+    type checks. Run once per match before any extract_* call.
+    """
+    if not isinstance(m.get(HOME_TEAM), dict):
+        m[HOME_TEAM] = _EMPTY
+    if not isinstance(m.get(AWAY_TEAM), dict):
+        m[AWAY_TEAM] = _EMPTY
+    return m
 
 
-def get_nested(d: dict, *path, default: str = "") -> str:
-    cur = d
-    for p in path:
-        if not isinstance(cur, dict):
-            return default
-        cur = cur.get(p)
-    if isinstance(cur, str):
-        return cur
-    return default
+def pick(m: dict, paths: Tuple[Tuple[str, ...], ...]) -> str:
+    for path in paths:
+        cur = m
+        try:
+            for p in path:
+                cur = cur.get(p)
+        except AttributeError:  # walked into a non-dict
+            continue
+        if isinstance(cur, str):
+            cur = cur.strip()
+            if cur:
+                return cur
+    return ""
 
 
 def extract_time(m: dict) -> str:
     # Common fields seen across BracketTeam payloads
-    return first_nonempty(
-        m.get("start_date_time"),
-        m.get("date"),
-        m.get("start_time"),
-        m.get("start_datetime"),
-        # Sometimes “start_time” is separate and needs the date
-    )
+    return pick(m, TIME_PATHS)
 
 
 def extract_location(m: dict) -> str:
-    return first_nonempty(
-            get_nested(m, "court", "venue", "name", default=""),
-            m.get("venue_name"),
-            m.get("facility_name"),
-            m.get("location"),
-            get_nested(m, "venue", "name", default=""),
-            get_nested(m, "facility", "name", default=""),
-            get_nested(m, "site", "name", default=""),
-    )
+    return pick(m, LOCATION_PATHS)
 
 
 def extract_court(m: dict) -> str:
-    return first_nonempty(
-            get_nested(m, "court", "court_name", default=""),
-            m.get("court_name"),
-            m.get("court"),
-            m.get("field"),
-            get_nested(m, "court", "name", default=""),
-            get_nested(m, "resource", "name", default=""),
-            )
+    return pick(m, COURT_PATHS)
 
 
 def extract_team_name(obj: Optional[dict], fallback_keys: Iterable[str]) -> str:
@@ -200,73 +600,211 @@ def extract_team_name(obj: Optional[dict], fallback_keys: Iterable[str]) -> str:
 
 def extract_home(m: dict) -> str:
     # Try nested home_team first; then some flat variants if present
-    if isinstance(m.get("home_team"), dict):
-        v = m["home_team"].get("name") or m["home_team"].get("team_name")
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-    return first_nonempty(
-        m.get("home_name"),
-        m.get("homeTeamName"),
-        m.get("team_home_name"),
-    )
+    h = m[HOME_TEAM]
+    v = h.get("name") or h.get("team_name")
+    if isinstance(v, str) and (vs := v.strip()):
+        return vs
+    return pick(m, HOME_NAME_PATHS)
 
 
 def extract_away(m: dict) -> str:
-    if isinstance(m.get("away_team"), dict):
-        v = m["away_team"].get("name") or m["away_team"].get("team_name")
-        if isinstance(v, str) and v.strip():
-            return v.strip()
-    return first_nonempty(
-        m.get("away_name"),
-        m.get("awayTeamName"),
-        m.get("team_away_name"),
-    )
+    a = m[AWAY_TEAM]
+    v = a.get("name") or a.get("team_name")
+    if isinstance(v, str) and (vs := v.strip()):
+        return vs
+    return pick(m, AWAY_NAME_PATHS)
 
 # --- Main --------------------------------------------------------------------
 
+FIELDNAMES = ("game_start_time", "location", "court", "division", "home_team", "away_team")
+Row = namedtuple("Row", FIELDNAMES)
 
-def run(event_ref: str, out_csv: str, token: Optional[str]) -> int:
-    tournament_id = parse_event_id(event_ref)
-    token = token or os.environ.get("BRACKETTEAM_TOKEN") or "fB0SC4jghlUrszbzgFmHyAPeWvzwc5kWV3yhdP9xhs8ysLRkDDGpomh5gmqoZdAc"
-    if not token:
-        sys.stderr.write("Missing API token. Provide --token or set BRACKETTEAM_TOKEN.\n")
-        return 2
 
-    session = make_session(token)
+async def fetch_division(
+        client: httpx.AsyncClient,
+        sem: asyncio.Semaphore,
+        page_sem: asyncio.Semaphore,
+        queue: "asyncio.Queue[Optional[List[Row]]]",
+        tournament_id: int,
+        div_id: int,
+        div_name: str,
+        page_size: int) -> None:
+    """
+    Collects every row for one division and hands them to the CSV writer.
+    """
+    async with sem:
+        rows: List[Row] = []
+        async for m in iter_matches(client, page_sem, tournament_id, div_id, page_size):
+            normalize(m)
+            rows.append(Row(
+                extract_time(m),
+                extract_location(m),
+                extract_court(m),
+                div_name,
+                extract_home(m),
+                extract_away(m),
+            ))
+        await queue.put(rows)
+
+
+async def write_rows(
+        queue: "asyncio.Queue[Optional[List[Row]]]",
+        w: Any) -> int:
+    """
+    Single consumer: drains division batches into the CSV until sentinel,
+    one writerows call per batch.
+    """
+    rows_written = 0
+    while True:
+        rows = await queue.get()
+        if rows is None:
+            return rows_written
+        w.writerows(rows)
+        rows_written += len(rows)
+
+
+def open_csv(out_csv: str) -> io.TextIOWrapper:
+    return io.TextIOWrapper(open(out_csv, "wb", buffering=CSV_BUFFER_SIZE),
+                            encoding="utf-8", newline="", write_through=False)
+
+
+def use_parse_executor() -> None:
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=PARSE_WORKERS))
+
+
+async def fetch_divisions(
+        client: httpx.AsyncClient,
+        queue: "asyncio.Queue[Optional[List[Row]]]",
+        tournament_id: int,
+        divisions: List[Tuple[int, str]],
+        page_size: int) -> None:
+    sem = asyncio.Semaphore(MAX_CONCURRENT_DIVISIONS)
+    page_sem = asyncio.Semaphore(MAX_CONCURRENT_PAGES)
+    await asyncio.gather(*[
+        fetch_division(client, sem, page_sem, queue, tournament_id, div_id, div_name,
+                       page_size)
+        for div_id, div_name in divisions
+    ])
+
+
+async def scrape(tournament_id: int, out_csv: str, token: str, page_size: int) -> int:
+    use_parse_executor()
+    async with make_client(token) as client:
+        divisions = await get_divisions(client, tournament_id)
+        if not divisions:
+            sys.stderr.write(f"No divisions found for tournament {tournament_id}\n")
+            return 1
+
+        # Write CSV
+        with open_csv(out_csv) as f:
+            w = csv.writer(f)
+            w.writerow(FIELDNAMES)
+
+            queue: "asyncio.Queue[Optional[List[Row]]]" = asyncio.Queue()
+            writer = asyncio.create_task(write_rows(queue, w))
+            await fetch_divisions(client, queue, tournament_id, divisions, page_size)
+            await queue.put(None)
+            rows_written = await writer
+
+    print(f"Wrote {rows_written} games to {out_csv}")
+    return 0
+
 
-    divisions = get_divisions(session, tournament_id)
+# --- Multi-process mode --------------------------------------------------------
+
+ShardJob = Tuple[int, List[Tuple[int, str]], str, int, bool]  # tournament, divisions, token, page size, disk cache
+
+
+async def list_divisions(token: str, tournament_id: int) -> List[Tuple[int, str]]:
+    async with make_client(token) as client:
+        return await get_divisions(client, tournament_id)
+
+
+async def collect_shard(
+        tournament_id: int,
+        divisions: List[Tuple[int, str]],
+        token: str,
+        page_size: int,
+        use_cache: bool) -> List[Row]:
+    global disk_cache_enabled
+    disk_cache_enabled = use_cache
+    use_parse_executor()
+    queue: "asyncio.Queue[Optional[List[Row]]]" = asyncio.Queue()
+    async with make_client(token) as client:
+        await fetch_divisions(client, queue, tournament_id, divisions, page_size)
+    rows: List[Row] = []
+    while not queue.empty():
+        rows.extend(queue.get_nowait())
+    return rows
+
+
+def scrape_shard(job: ShardJob) -> List[Row]:
+    """
+    Pool worker: scrapes its divisions with its own client and event loop.
+    """
+    return asyncio.run(collect_shard(*job))
+
+
+def scrape_in_processes(
+        tournament_id: int, out_csv: str, token: str, page_size: int, processes: int) -> int:
+    """
+    Splits divisions across a process pool. Workers return rows; this process
+    stays the only CSV writer and writes each shard as it arrives.
+    """
+    divisions = asyncio.run(list_divisions(token, tournament_id))
     if not divisions:
         sys.stderr.write(f"No divisions found for tournament {tournament_id}\n")
         return 1
 
-    # Write CSV
-    fieldnames = ["game_start_time", "location", "court", "division", "home_team", "away_team"]
+    n = min(processes, len(divisions))
+    jobs: List[ShardJob] = [(tournament_id, divisions[i::n], token, page_size, disk_cache_enabled)
+                            for i in range(n)]
     rows_written = 0
-    with open(out_csv, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-
-        for div_id, div_name in divisions:
-            for m in iter_matches(session, tournament_id, div_id):
-                w.writerow({
-                    "game_start_time": extract_time(m),
-                    "location":        extract_location(m),
-                    "court":           extract_court(m),
-                    "division":        div_name,
-                    "home_team":       extract_home(m),
-                    "away_team":       extract_away(m),
-                })
-                rows_written += 1
-            # be polite between divisions
-            time.sleep(SLEEP_TIME)
+    with open_csv(out_csv) as f:
+        w = csv.writer(f)
+        w.writerow(FIELDNAMES)
+        with multiprocessing.Pool(processes=n) as pool:
+            for rows in pool.imap_unordered(scrape_shard, jobs):
+                w.writerows(rows)
+                rows_written += len(rows)
 
     print(f"Wrote {rows_written} games to {out_csv}")
     return 0
 
+
+def positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return n
+
+
+def run(event_ref: str, out_csv: str, token: Optional[str],
+        page_size: int = DEFAULT_PAGE_SIZE, processes: int = 1, use_cache: bool = True) -> int:
+    global disk_cache_enabled
+    disk_cache_enabled = use_cache
+    tournament_id = parse_event_id(event_ref)
+    token = token or os.environ.get("BRACKETTEAM_TOKEN") or "fB0SC4jghlUrszbzgFmHyAPeWvzwc5kWV3yhdP9xhs8ysLRkDDGpomh5gmqoZdAc"
+    if not token:
+        sys.stderr.write("Missing API token. Provide --token or set BRACKETTEAM_TOKEN.\n")
+        return 2
+
+    if processes > 1:
+        return scrape_in_processes(tournament_id, out_csv, token, page_size, processes)
+    return asyncio.run(scrape(tournament_id, out_csv, token, page_size))
+
 if __name__ == "__main__":
     ap = argparse.ArgumentParser(description="Export a BracketTeam event's schedules to CSV.")
     ap.add_argument("event", help="Event URL like https://bracketteam.com/event/6489/... or just the numeric id (e.g., 6489)")
     ap.add_argument("-o", "--output", default="schedules.csv", help="Output CSV file (default: schedules.csv)")
     ap.add_argument("--token", default=None, help="X-Authorization token (or set BRACKETTEAM_TOKEN)")
+    ap.add_argument("--page-size", type=positive_int, default=DEFAULT_PAGE_SIZE,
+                    help=f"Matches requested per schedule page (default: {DEFAULT_PAGE_SIZE})")
+    ap.add_argument("-j", "--processes", type=positive_int, default=1,
+                    help="Split divisions across this many worker processes (default: 1)")
+    ap.add_argument("--no-cache", action="store_true",
+                    help=f"Always refetch instead of reusing responses cached under {DISK_CACHE_DIR}")
     args = ap.parse_args()
-    sys.exit(run(args.event, args.output, args.token))
+    sys.exit(run(args.event, args.output, args.token, args.page_size, args.processes,
+                 not args.no_cache))